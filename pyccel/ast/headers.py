@@ -517,7 +517,7 @@ class MacroFunction(Header):
         return d_arguments
 
 
-    def get_results_shapes(self, args):
+    def get_results_shapes(self, args, d_arguments=None):
         """replace elements of the shape with appropriate values
 
         Parameters
@@ -525,6 +525,9 @@ class MacroFunction(Header):
         args: iterable
             The arguments provided at function call
 
+        d_arguments: dict, optional
+            The result of link_args(args) if it has already been computed
+
         Results
         -------
         results_shapes: iterable
@@ -533,7 +536,8 @@ class MacroFunction(Header):
             from args.
         """
 
-        d_arguments = self.link_args(args)
+        if d_arguments is None:
+            d_arguments = self.link_args(args)
         results_shapes = []
         for result, shape in zip(self.results, self.results_shapes):
             newargs = []
@@ -567,12 +571,15 @@ class MacroFunction(Header):
             results_shapes.append(newargs)
         return results_shapes
 
-    def apply(self, args, results=None):
+    def apply(self, args, results=None, d_arguments=None):
         """Converts the arguments provided to the macro to arguments
-        appropriate for the FunctionCall to the associated function
+        appropriate for the FunctionCall to the associated function.
+        If link_args(args) has already been computed it can be passed
+        as d_arguments to avoid linking the arguments a second time.
         """
 
-        d_arguments = self.link_args(args)
+        if d_arguments is None:
+            d_arguments = self.link_args(args)
         d_results = {}
         if not(results is None) and not(self.results is None):
             for (r_macro, r) in zip(self.results, results):
@@ -12,7 +12,7 @@ from pyccel.utilities.stage import PyccelStage
 from .basic          import TypedAstNode
 from .datatypes      import NativeInteger, NativeGeneric
 from .internals      import PyccelSymbol
-from .variable       import Variable
+from .variable       import Variable, IndexedElement
 
 pyccel_stage = PyccelStage()
 
@@ -33,7 +33,7 @@ class Macro(TypedAstNode):
 
     Parameters
     ----------
-    argument : PyccelSymbol | Variable
+    argument : PyccelSymbol | Variable | IndexedElement
         The argument passed to the macro.
     """
     __slots__ = ('_argument',)
@@ -41,8 +41,8 @@ class Macro(TypedAstNode):
     _attribute_nodes = ()
 
     def __init__(self, argument):
-        if not isinstance(argument, (PyccelSymbol, Variable)):
-            raise TypeError(f"Argument must be a Pyccelsymbol or a Variable not {type(argument)}")
+        if not isinstance(argument, (PyccelSymbol, Variable, IndexedElement)):
+            raise TypeError(f"Argument must be a Pyccelsymbol, a Variable or an IndexedElement not {type(argument)}")
 
         self._argument = argument
         super().__init__()
@@ -64,7 +64,7 @@ class MacroShape(Macro):
 
     Parameters
     ----------
-    argument : PyccelSymbol | Variable
+    argument : PyccelSymbol | Variable | IndexedElement
         The variable whose shape we are accessing.
     index : int | LiteralInteger
         The index of the element of the shape we are accessing.
@@ -108,7 +108,7 @@ class MacroType(Macro):
 
     Parameters
     ----------
-    argument : PyccelSymbol | Variable
+    argument : PyccelSymbol | Variable | IndexedElement
         The variable whose datatype we are accessing.
     """
     __slots__ = ()
@@ -133,8 +133,9 @@ class MacroCount(Macro):
 
     Parameters
     ----------
-    argument : PyccelSymbol | Variable
-        The variable whose size we are accessing.
+    argument : PyccelSymbol | Variable | IndexedElement
+        The variable whose size we are accessing. When this is a slice the
+        count is the number of elements in the slice.
     """
     __slots__ = ()
     _name      = 'count'
@@ -1914,7 +1914,7 @@ class CCodePrinter(CodePrinter):
 
         args += self._temporary_args
         self._temporary_args = []
-        args = ', '.join(['{}'.format(self._print(a)) for a in args])
+        args = ', '.join(map(self._print, args))
 
         call_code = f'{func.name}({args})'
         if not func.results:
@@ -10,6 +10,7 @@ www.fortran90.org as much as possible."""
 import string
 import re
 from itertools import chain
+from math import prod
 from collections import OrderedDict
 
 import functools
@@ -166,6 +167,16 @@ math_function_to_fortran = {
     'CmathTanh'  : 'tanh',
 }
 
+mpi_datatypes = {
+    (NativeInteger(), 4)  : 'MPI_INTEGER',
+    (NativeInteger(), 8)  : 'MPI_INTEGER8',
+    (NativeFloat()  , 4)  : 'MPI_FLOAT',
+    (NativeFloat()  , 8)  : 'MPI_DOUBLE',
+    (NativeComplex(), 4)  : 'MPI_COMPLEX8',
+    (NativeComplex(), 8)  : 'MPI_COMPLEX16',
+    (NativeBool()   , -1) : 'MPI_C_BOOL',
+}
+
 INF = math_constants['inf']
 
 _default_methods = {
@@ -230,6 +241,11 @@ class FCodePrinter(CodePrinter):
         self._additional_code = None
         self._additional_imports = set()
 
+        # Total number of elements of the arguments of MacroCount, keyed on
+        # the id of the variable. The variable is stored with its count so
+        # that the id cannot be reused while the printer is alive
+        self._macro_counts = {}
+
         self.prefix_module = prefix_module
 
     def print_constant_imports(self):
@@ -544,7 +560,7 @@ class FCodePrinter(CodePrinter):
     def _print_Program(self, expr):
         self.set_scope(expr.scope)
 
-        name    = 'prog_{0}'.format(self._print(expr.name)).replace('.', '_')
+        name    = f'prog_{self._print(expr.name)}'.replace('.', '_')
         imports = ''.join(self._print(i) for i in expr.imports)
         body    = self._print(expr.body)
 
@@ -561,22 +577,22 @@ class FCodePrinter(CodePrinter):
         # Additional code and variable declarations for MPI usage
         # TODO: check if we should really add them like this
         if mpi:
-            body = 'call mpi_init(ierr)\n'+\
-                   '\nallocate(status(0:-1 + mpi_status_size)) '+\
-                   '\nstatus = 0\n'+\
-                   body +\
-                   '\ncall mpi_finalize(ierr)'
-
-            decs += '\ninteger :: ierr = -1' +\
-                    '\ninteger, allocatable :: status (:)'
+            body = ('call mpi_init(ierr)\n'
+                    '\nallocate(status(0:-1 + mpi_status_size)) '
+                    '\nstatus = 0\n'
+                    f'{body}'
+                    '\ncall mpi_finalize(ierr)')
+
+            decs += ('\ninteger :: ierr = -1'
+                     '\ninteger, allocatable :: status (:)')
         imports += ''.join(self._print(i) for i in self._additional_imports)
         imports += "\n" + self.print_constant_imports()
-        parts = ['program {}\n'.format(name),
+        parts = [f'program {name}\n',
                  imports,
                 'implicit none\n',
                  decs,
                  body,
-                'end program {}\n'.format(name)]
+                f'end program {name}\n']
 
         self.exit_scope()
 
@@ -1343,7 +1359,7 @@ class FCodePrinter(CodePrinter):
     def _print_MacroShape(self, expr):
         var = expr.argument
         if not isinstance(var, (Variable, IndexedElement)):
-            raise TypeError('Expecting a variable, given {}'.format(type(var)))
+            raise TypeError(f'Expecting a variable, given {type(var)}')
         shape = var.shape
 
         if len(shape) == 1:
@@ -1360,28 +1376,10 @@ class FCodePrinter(CodePrinter):
 
     # ...
     def _print_MacroType(self, expr):
-        dtype = self._print(expr.argument.dtype)
-        prec  = expr.argument.precision
-
-        if dtype == 'integer':
-            if prec==4:
-                return 'MPI_INTEGER'
-            elif prec==8:
-                return 'MPI_INTEGER8'
-            else:
-                errors.report(PYCCEL_RESTRICTION_TODO, symbol=expr,
-                    severity='fatal')
-
-        elif dtype == 'float':
-            if prec==8:
-                return 'MPI_DOUBLE'
-            if prec==4:
-                return 'MPI_FLOAT'
-            else:
-                errors.report(PYCCEL_RESTRICTION_TODO, symbol=expr,
-                    severity='fatal')
-
-        else:
+        var = expr.argument
+        try:
+            return mpi_datatypes[(var.dtype, get_final_precision(var))]
+        except KeyError:
             errors.report(PYCCEL_RESTRICTION_TODO, symbol=expr,
                 severity='fatal')
 
@@ -1391,9 +1389,27 @@ class FCodePrinter(CodePrinter):
 
         if var.rank == 0:
             return '1'
-        else:
-            return self._print(functools.reduce(
-                lambda x,y: PyccelMul(x,y,simplify=True), var.shape))
+
+        # Only variables are cached, an IndexedElement is a new object
+        # each time the macro is applied
+        cached = self._macro_counts.get(id(var)) if isinstance(var, Variable) else None
+        if cached is None:
+            # Group the literal elements of the shape into a single factor
+            sizes = [s for s in var.shape if not isinstance(s, LiteralInteger)]
+            literal_size = prod(s.python_value for s in var.shape if isinstance(s, LiteralInteger))
+            if literal_size != 1 or not sizes:
+                sizes.append(LiteralInteger(literal_size))
+            count = functools.reduce(
+                lambda x,y: PyccelMul(x,y,simplify=True), sizes)
+            if isinstance(var, IndexedElement):
+                # The extent of a slice is computed with ceiling which
+                # returns a default kind integer
+                count = PythonInt(count)
+            cached = (var, count)
+            if isinstance(var, Variable):
+                self._macro_counts[id(var)] = cached
+
+        return self._print(cached[1])
 
     def _print_Declare(self, expr):
         # ... ignored declarations
@@ -2200,141 +2216,141 @@ class FCodePrinter(CodePrinter):
         return self._get_statement(code)
 
     def _print_ACC_Async(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'async({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'async({args})'
 
     def _print_ACC_Auto(self, expr):
         return 'auto'
 
     def _print_ACC_Bind(self, expr):
-        return 'bind({})'.format(self._print(expr.variable))
+        return f'bind({self._print(expr.variable)})'
 
     def _print_ACC_Collapse(self, expr):
-        return 'collapse({0})'.format(self._print(expr.n_loops))
+        return f'collapse({self._print(expr.n_loops)})'
 
     def _print_ACC_Copy(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'copy({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'copy({args})'
 
     def _print_ACC_Copyin(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'copyin({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'copyin({args})'
 
     def _print_ACC_Copyout(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'copyout({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'copyout({args})'
 
     def _print_ACC_Create(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'create({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'create({args})'
 
     def _print_ACC_Default(self, expr):
-        return 'default({})'.format(self._print(expr.status))
+        return f'default({self._print(expr.status)})'
 
     def _print_ACC_DefaultAsync(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'default_async({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'default_async({args})'
 
     def _print_ACC_Delete(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'delete({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'delete({args})'
 
     def _print_ACC_Device(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'device({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'device({args})'
 
     def _print_ACC_DeviceNum(self, expr):
-        return 'collapse({0})'.format(self._print(expr.n_device))
+        return f'collapse({self._print(expr.n_device)})'
 
     def _print_ACC_DevicePtr(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'deviceptr({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'deviceptr({args})'
 
     def _print_ACC_DeviceResident(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'device_resident({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'device_resident({args})'
 
     def _print_ACC_DeviceType(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'device_type({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'device_type({args})'
 
     def _print_ACC_Finalize(self, expr):
         return 'finalize'
 
     def _print_ACC_FirstPrivate(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'firstprivate({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'firstprivate({args})'
 
     def _print_ACC_Gang(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'gang({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'gang({args})'
 
     def _print_ACC_Host(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'host({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'host({args})'
 
     def _print_ACC_If(self, expr):
-        return 'if({})'.format(self._print(expr.test))
+        return f'if({self._print(expr.test)})'
 
     def _print_ACC_Independent(self, expr):
         return 'independent'
 
     def _print_ACC_Link(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'link({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'link({args})'
 
     def _print_ACC_NoHost(self, expr):
         return 'nohost'
 
     def _print_ACC_NumGangs(self, expr):
-        return 'num_gangs({0})'.format(self._print(expr.n_gang))
+        return f'num_gangs({self._print(expr.n_gang)})'
 
     def _print_ACC_NumWorkers(self, expr):
-        return 'num_workers({0})'.format(self._print(expr.n_worker))
+        return f'num_workers({self._print(expr.n_worker)})'
 
     def _print_ACC_Present(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'present({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'present({args})'
 
     def _print_ACC_Private(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'private({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'private({args})'
 
     def _print_ACC_Reduction(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
+        args = ', '.join(map(self._print, expr.variables))
         op   = self._print(expr.operation)
-        return "reduction({0}: {1})".format(op, args)
+        return f"reduction({op}: {args})"
 
     def _print_ACC_Self(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'self({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'self({args})'
 
     def _print_ACC_Seq(self, expr):
         return 'seq'
 
     def _print_ACC_Tile(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'tile({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'tile({args})'
 
     def _print_ACC_UseDevice(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'use_device({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'use_device({args})'
 
     def _print_ACC_Vector(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'vector({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'vector({args})'
 
     def _print_ACC_VectorLength(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'vector_length({})'.format(self._print(expr.n))
+        args = ', '.join(map(self._print, expr.variables))
+        return f'vector_length({self._print(expr.n)})'
 
     def _print_ACC_Wait(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'wait({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'wait({args})'
 
     def _print_ACC_Worker(self, expr):
-        args = ', '.join('{0}'.format(self._print(i)) for i in expr.variables)
-        return 'worker({})'.format(args)
+        args = ', '.join(map(self._print, expr.variables))
+        return f'worker({args})'
     # .....................................................
 
     #def _print_Block(self, expr):
@@ -2924,8 +2940,9 @@ class FCodePrinter(CodePrinter):
         func = expr.funcdef
 
         f_name = self._print(expr.func_name if not expr.interface else expr.interface_name)
-        for k, m in _default_methods.items():
-            f_name = f_name.replace(k, m)
+        if '__' in f_name:
+            for k, m in _default_methods.items():
+                f_name = f_name.replace(k, m)
         args   = expr.args
         func_results  = [r.var for r in func.results]
         parent_assign = expr.get_direct_user_nodes(lambda x: isinstance(x, (Assign, AliasAssign)))
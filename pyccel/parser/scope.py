@@ -241,17 +241,23 @@ class Scope(object):
         pyccel.ast.basic.PyccelAstNode
             The object stored in the scope.
         """
-        for l in ([category] if category else self._locals.keys()):
-            if name in self._locals[l]:
-                return self._locals[l][name]
-
-            if name in self.imports[l]:
-                return self.imports[l][name]
+        categories = [category] if category else self._locals.keys()
+        scope = self
+        while True:
+            for l in categories:
+                if name in scope._locals[l]:
+                    return scope._locals[l][name]
+
+                if name in scope._imports[l]:
+                    return scope._imports[l][name]
+
+            # Walk up the tree of Scope objects, until the root if needed
+            if scope.parent_scope and (scope.is_loop or not local_only):
+                scope = scope.parent_scope
+            else:
+                break
 
-        # Walk up the tree of Scope objects, until the root if needed
-        if self.parent_scope and (self.is_loop or not local_only):
-            return self.parent_scope.find(name, category, local_only, raise_if_missing)
-        elif raise_if_missing:
+        if raise_if_missing:
             raise RuntimeError(f"Can't find expected object {name} in scope")
         else:
             return None
@@ -133,7 +133,8 @@ from pyccel.errors.messages import (PYCCEL_RESTRICTION_TODO, UNDERSCORE_NOT_A_TH
         PYCCEL_RESTRICTION_LIST_COMPREHENSION_LIMITS, PYCCEL_RESTRICTION_LIST_COMPREHENSION_SIZE,
         UNUSED_DECORATORS, UNSUPPORTED_POINTER_RETURN_VALUE, PYCCEL_RESTRICTION_OPTIONAL_NONE,
         PYCCEL_RESTRICTION_PRIMITIVE_IMMUTABLE, PYCCEL_RESTRICTION_IS_ISNOT,
-        FOUND_DUPLICATED_IMPORT, UNDEFINED_WITH_ACCESS, MACRO_MISSING_HEADER_OR_FUNC, PYCCEL_RESTRICTION_INHOMOG_SET)
+        FOUND_DUPLICATED_IMPORT, UNDEFINED_WITH_ACCESS, MACRO_MISSING_HEADER_OR_FUNC, PYCCEL_RESTRICTION_INHOMOG_SET,
+        FORTRAN_NON_CONTIGUOUS_MPI_BUFFER)
 
 from pyccel.parser.base      import BasicParser
 from pyccel.parser.syntactic import SyntaxParser
@@ -168,6 +169,67 @@ def _get_name(var):
 
 #==============================================================================
 
+# MPI routines whose request keeps the address of the buffer after they return
+mpi_request_buffer_routines = ('mpi_isend', 'mpi_issend', 'mpi_ibsend', 'mpi_irecv',
+                               'mpi_send_init', 'mpi_recv_init')
+
+def _is_contiguous_section(expr):
+    """
+    Check if an indexed array is a contiguous section of its base.
+
+    Check if an indexed array is a contiguous section of its base. Starting
+    from the fastest varying index, the section is contiguous if all the
+    indices are full slices up to a single partial slice with a unit step,
+    and all the remaining indices are scalars.
+
+    Parameters
+    ----------
+    expr : IndexedElement
+        The indexed array.
+
+    Returns
+    -------
+    bool
+        True if the elements of the section are contiguous in memory.
+    """
+    indices = expr.indices if expr.base.order == 'F' else expr.indices[::-1]
+    partial = False
+    for i in indices:
+        if not isinstance(i, Slice):
+            partial = True
+        elif partial or i.step not in (None, 1):
+            return False
+        else:
+            partial = i.start not in (None, 0) or i.stop is not None
+    return True
+
+def _check_mpi_request_buffers(func, args):
+    """
+    Check that the buffers of a non-blocking or persistent MPI call are contiguous.
+
+    Fortran passes a non contiguous array section to an MPI routine as a
+    temporary copy. This copy is freed when the call returns, before the
+    request which uses it completes, so such a section is reported as an
+    error.
+
+    Parameters
+    ----------
+    func : FunctionDef
+        The function being called.
+
+    args : list of FunctionCallArgument
+        The arguments passed to the function.
+    """
+    if func.name not in mpi_request_buffer_routines:
+        return
+    for a in args:
+        buf = a.value
+        if isinstance(buf, IndexedElement) and buf.rank > 0 and not _is_contiguous_section(buf):
+            errors.report(FORTRAN_NON_CONTIGUOUS_MPI_BUFFER.format(func.name),
+                    symbol=buf, severity='error')
+
+#==============================================================================
+
 class SemanticParser(BasicParser):
     """
     Class which handles the semantic stage as described in the developer docs.
@@ -1169,6 +1231,8 @@ class SemanticParser(BasicParser):
 
             args = input_args
 
+            _check_mpi_request_buffers(func, args)
+
             new_expr = FunctionCall(func, args, self._current_function)
 
             for a, f_a in zip(new_expr.args, func_args):
@@ -2640,6 +2704,7 @@ class SemanticParser(BasicParser):
                 args = [lhs] + list(args)
                 args = [self._visit(i) for i in args]
                 args = macro.apply(args)
+                _check_mpi_request_buffers(master.funcdef, args)
                 return FunctionCall(master, args, self._current_function)
 
             args = [FunctionCallArgument(visited_lhs), *self._handle_function_args(rhs.args)]
@@ -3032,7 +3097,8 @@ class SemanticParser(BasicParser):
 
                 if not sympy_iterable(lhs):
                     lhs = [lhs]
-                results_shapes = macro.get_results_shapes(args)
+                d_arguments = macro.link_args(args)
+                results_shapes = macro.get_results_shapes(args, d_arguments)
                 for m_result, shape, result in zip(macro.results, results_shapes, lhs):
                     if m_result in d_m_args and not result in args_names:
                         d_result = self._infer_type(d_m_args[m_result])
@@ -3051,8 +3117,9 @@ class SemanticParser(BasicParser):
 
                 expr = macro.make_necessary_copies(args, results)
                 new_expressions += expr
-                args = macro.apply(args, results=results)
+                args = macro.apply(args, results=results, d_arguments=d_arguments)
                 if isinstance(master.funcdef, FunctionDef):
+                    _check_mpi_request_buffers(master.funcdef, args)
                     func_call = FunctionCall(master.funcdef, args, self._current_function)
                     if new_expressions:
                         return CodeBlock([*new_expressions, func_call])
@@ -25,11 +25,16 @@ from pyccel.stdlib.internal.mpi import mpi_ibsend
 from pyccel.stdlib.internal.mpi import mpi_recv
 from pyccel.stdlib.internal.mpi import mpi_irecv
 
+from pyccel.stdlib.internal.mpi import mpi_send_init
+from pyccel.stdlib.internal.mpi import mpi_recv_init
+from pyccel.stdlib.internal.mpi import mpi_startall
+
 from pyccel.stdlib.internal.mpi import mpi_sendrecv
 
 from pyccel.stdlib.internal.mpi import mpi_bcast
 
 from pyccel.stdlib.internal.mpi import mpi_barrier
+from pyccel.stdlib.internal.mpi import mpi_ibarrier
 from pyccel.stdlib.internal.mpi import mpi_gather
 from pyccel.stdlib.internal.mpi import mpi_allgatherv
 
@@ -41,6 +46,7 @@ from pyccel.stdlib.internal.mpi import mpi_waitall
 from pyccel.stdlib.internal.mpi import mpi_comm_split
 from pyccel.stdlib.internal.mpi import mpi_comm_free
 
+from pyccel.stdlib.internal.mpi import mpi_type_contiguous
 from pyccel.stdlib.internal.mpi import mpi_type_vector
 from pyccel.stdlib.internal.mpi import mpi_type_commit
 from pyccel.stdlib.internal.mpi import ANY_TAG
@@ -173,6 +179,7 @@ ierr = -1
 #$ header macro (x), y.Split(color=0, key=0) := mpi_comm_split(y, int32(color), int32(key), x, ierr)
 #$ header macro y.Free() := mpi_comm_free(y, ierr)
 #$ header macro (datatype),y.Create_vector(count, blocklength, stride) := mpi_type_vector(int32(count), int32(blocklength), int32(stride), y.dtype, datatype, ierr)
+#$ header macro (datatype),y.Create_contiguous(count) := mpi_type_contiguous(int32(count), y, datatype, ierr)
 #$ header macro x.Commit() := mpi_type_commit(x, ierr)
 
 
@@ -184,6 +191,9 @@ ierr = -1
 #$ header macro  (req), y.Ibsend([data, count=data.count, dtype=data.dtype], dest=0, tag=0) := mpi_ibsend(data, int32(count), dtype, int32(dest), int32(tag), y, ierr)
 #$ header macro  (req), y.Irecv ([data, count=data.count, dtype=data.dtype], source=ANY_SOURCE, tag=ANY_TAG) := mpi_irecv(data, int32(count), dtype, int32(source), int32(tag), y, int32(req), ierr)
 
+#$ header macro  (req), y.Send_init([data, count=data.count, dtype=data.dtype], dest=0, tag=0) := mpi_send_init(data, int32(count), dtype, int32(dest), int32(tag), y, int32(req), ierr)
+#$ header macro  (req), y.Recv_init([data, count=data.count, dtype=data.dtype], source=ANY_SOURCE, tag=ANY_TAG) := mpi_recv_init(data, int32(count), dtype, int32(source), int32(tag), y, int32(req), ierr)
+
 
 #$ header macro (x), y.Sendrecv(sendobj, dest, sendtag=0, recvbuf=x, source=ANY_SOURCE, recvtag=ANY_TAG) := mpi_sendrecv(sendobj, sendobj.count, sendobj.dtype, int32(dest), int32(sendtag), recvbuf, recvbuf.count, recvbuf.dtype, int32(source), int32(recvtag), y, MPI_STATUS_IGNORE, ierr)
 
@@ -196,5 +206,7 @@ ierr = -1
 #$ header macro  y.Bcast(data, root=0) := mpi_bcast(data, data.count, data.dtype, int32(root), y, ierr)
 
 #$ header macro  x.Waitall(req) := mpi_waitall(req.count, req, MPI_STATUSES_IGNORE, ierr)
+#$ header macro  x.Startall(req) := mpi_startall(req.count, req, ierr)
 
 #$ header macro  y.Barrier() := mpi_barrier(y, ierr)
+#$ header macro  (req), y.Ibarrier() := mpi_ibarrier(y, int32(req), ierr)
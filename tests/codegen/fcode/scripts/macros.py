@@ -64,6 +64,40 @@ def h(n, a, b):
     b[:] = a[:]
 # .....................................
 
+# .....................................
+#       count of an array whose shape changes
+# .....................................
+#$ header function g(int, int [:])
+#$ header macro __g(x) := g(x.count, x)
+def g(n, a):
+    a[:] = n
+
+#$ header function g1(int)
+def g1(m):
+    x = zeros(6, 'int')
+    for i in range(3):
+        __g(x)
+        x = zeros(m + i, 'int')
+# .....................................
+
+# .....................................
+#       count of a slice
+# .....................................
+#$ header function g2d(int, int [:,:])
+#$ header macro __g2d(x) := g2d(x.count, x)
+def g2d(n, a):
+    a[:,:] = n
+# .....................................
+
+# .....................................
+#       datatype of an array
+# .....................................
+#$ header function d(int32, int32 [:] | int64 [:] | float32 [:] | float64 [:] | complex64 [:] | complex128 [:] | bool [:])
+#$ header macro __d(x) := d(x.dtype, x)
+def d(t, a):
+    a[:] = a[0]
+# .....................................
+
 
 # ... 1d array
 a = zeros(4, 'int')
@@ -83,6 +117,35 @@ __k2d(b)
 k2d1(3,5)
 # ...
 
+# ... array reallocated in a loop
+g1(8)
+# ...
+
+# ... slices
+a2 = zeros(6, 'int')
+__g(a2[::2])
+__g(a2[1:4])
+c = zeros((3,6), 'int')
+__g2d(c[:, ::2])
+# ...
+
+# ... datatypes
+d0 = zeros(4, 'int32')
+__d(d0)
+d1 = zeros(4, 'int64')
+__d(d1)
+d2 = zeros(4, 'float32')
+__d(d2)
+d3 = zeros(4, 'float64')
+__d(d3)
+d4 = zeros(4, 'complex64')
+__d(d4)
+d5 = zeros(4, 'complex128')
+__d(d5)
+d6 = zeros(4, 'bool')
+__d(d6)
+# ...
+
 # ... macros with results
 a1 = zeros(4, 'int')
 b1 = zeros(4, 'int')
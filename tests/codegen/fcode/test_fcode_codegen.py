@@ -50,6 +50,27 @@ def test_codegen(f):
     # Assert codegen success
     assert(not errors.has_errors())
 
+@pytest.mark.fortran
+def test_macro_datatypes():
+
+    # reset Errors singleton
+    errors = Errors()
+    errors.reset()
+
+    f = os.path.join(path_dir, 'macros.py')
+
+    pyccel = Parser(f)
+    pyccel.parse()
+    ast = pyccel.annotate()
+
+    code = Codegen(ast, 'macros').doprint()
+
+    # Bool arrays are logical(C_BOOL) so they need the 1 byte MPI_C_BOOL
+    datatypes = ['MPI_INTEGER', 'MPI_INTEGER8', 'MPI_FLOAT', 'MPI_DOUBLE',
+                 'MPI_COMPLEX8', 'MPI_COMPLEX16', 'MPI_C_BOOL']
+    for i, dtype in enumerate(datatypes):
+        assert f'call d({dtype}, d{i})' in code
+
 ######################
 if __name__ == '__main__':
     print('*********************************')
@@ -0,0 +1,46 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring
+
+#==============================================================================
+
+#
+# Non-blocking ring exchange of contiguous array sections
+#
+
+def ring_sections(x : 'float[:]', y : 'float[:]', a : 'float[:,:]', b : 'float[:,:]'):
+    from pyccel.stdlib.internal.mpi import mpi_comm_size
+    from pyccel.stdlib.internal.mpi import mpi_comm_rank
+    from pyccel.stdlib.internal.mpi import mpi_comm_world
+    from pyccel.stdlib.internal.mpi import mpi_status_size
+    from pyccel.stdlib.internal.mpi import mpi_isend
+    from pyccel.stdlib.internal.mpi import mpi_irecv
+    from pyccel.stdlib.internal.mpi import mpi_waitall
+    from pyccel.stdlib.internal.mpi import MPI_REAL8
+    import numpy as np
+
+    ierr = np.int32(-1)
+    sizes = np.int32(-1)
+    rank = np.int32(-1)
+
+    comm = mpi_comm_world
+    mpi_comm_size(comm, sizes, ierr)
+    mpi_comm_rank(comm, rank, ierr)
+
+    before = np.int32((rank - 1) % sizes)
+    after  = np.int32((rank + 1) % sizes)
+
+    tag0 = np.int32(1234)
+    tag1 = np.int32(5678)
+    nreqs = np.int32(4)
+    reqs = np.zeros(nreqs, 'int32')
+    statuses = np.zeros((mpi_status_size, nreqs), 'int32')
+
+    n = np.int32(2)
+    m = np.int32(a.shape[1])
+
+    mpi_irecv(y[1:3], n, MPI_REAL8, before, tag0, comm, reqs[0], ierr)
+    mpi_irecv(b[1,:], m, MPI_REAL8, before, tag1, comm, reqs[1], ierr)
+
+    mpi_isend(x[1:3], n, MPI_REAL8, after, tag0, comm, reqs[2], ierr)
+    mpi_isend(a[1,:], m, MPI_REAL8, after, tag1, comm, reqs[3], ierr)
+
+    mpi_waitall(nreqs, reqs, statuses, ierr)
@@ -73,3 +73,30 @@ def test_function(language):
     h_fast(x)
 
     assert np.array_equal(x, x_expected)
+
+#==============================================================================
+@pytest.mark.parallel
+@pytest.mark.fortran
+def test_nonblocking_sections():
+    from modules.mpi_sections import ring_sections
+
+    comm = MPI.COMM_WORLD
+
+    f = epyccel(ring_sections, comm=comm, language='fortran')
+
+    rank = comm.rank
+    before = (rank - 1) % comm.size
+
+    x = np.full(4, float(rank))
+    y = np.zeros(4)
+    a = np.full((3, 5), float(rank))
+    b = np.zeros((3, 5))
+
+    f(x, y, a, b)
+
+    y_expected = np.array([0., before, before, 0.])
+    b_expected = np.zeros((3, 5))
+    b_expected[1,:] = before
+
+    assert np.array_equal(y, y_expected)
+    assert np.array_equal(b, b_expected)
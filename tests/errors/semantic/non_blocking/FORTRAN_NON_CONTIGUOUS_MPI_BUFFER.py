@@ -0,0 +1,24 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring
+from pyccel.stdlib.internal.mpi import mpi_init
+from pyccel.stdlib.internal.mpi import mpi_finalize
+from pyccel.stdlib.internal.mpi import mpi_comm_world
+from pyccel.stdlib.internal.mpi import mpi_irecv
+from pyccel.stdlib.internal.mpi import MPI_REAL8
+
+import numpy as np
+
+if __name__ == '__main__':
+    ierr = np.int32(-1)
+    mpi_init(ierr)
+
+    n = np.int32(4)
+    y = np.zeros(2*n)
+    req = np.int32(-1)
+    source = np.int32(0)
+    tag = np.int32(1234)
+
+    # The strided section is passed as a temporary copy which is freed
+    # before the request completes
+    mpi_irecv(y[::2], n, MPI_REAL8, source, tag, mpi_comm_world, req, ierr)
+
+    mpi_finalize(ierr)
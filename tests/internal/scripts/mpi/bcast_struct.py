@@ -0,0 +1,61 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring
+# coding: utf-8
+
+from pyccel.stdlib.internal.mpi import mpi_init
+from pyccel.stdlib.internal.mpi import mpi_finalize
+from pyccel.stdlib.internal.mpi import mpi_comm_size
+from pyccel.stdlib.internal.mpi import mpi_comm_rank
+from pyccel.stdlib.internal.mpi import mpi_comm_world
+from pyccel.stdlib.internal.mpi import mpi_bcast
+from pyccel.stdlib.internal.mpi import mpi_get_address
+from pyccel.stdlib.internal.mpi import mpi_type_create_struct
+from pyccel.stdlib.internal.mpi import mpi_type_commit
+from pyccel.stdlib.internal.mpi import mpi_type_free
+from pyccel.stdlib.internal.mpi import MPI_INTEGER8
+from pyccel.stdlib.internal.mpi import MPI_REAL8
+from pyccel.stdlib.internal.mpi import MPI_BOTTOM
+
+import numpy as np
+
+if __name__ == '__main__':
+    # we need to declare these variables somehow,
+    # since we are calling mpi subroutines
+    ierr = np.int32(-1)
+    sizes = np.int32(-1)
+    rank = np.int32(-1)
+
+    mpi_init(ierr)
+
+    comm = mpi_comm_world
+    mpi_comm_size(comm, sizes, ierr)
+    mpi_comm_rank(comm, rank, ierr)
+
+    master = np.int32(1)
+    n  = np.zeros(1, 'int')
+    dx = np.zeros(1, 'float')
+    if rank == master:
+        n[0]  = 100
+        dx[0] = 0.01
+
+    # Group both values in a single datatype so that one broadcast is needed
+    blocklens = np.ones(2, 'int32')
+    displs    = np.zeros(2, 'int64')
+    types     = np.zeros(2, 'int32')
+    types[0]  = MPI_INTEGER8
+    types[1]  = MPI_REAL8
+    mpi_get_address (n, displs[0], ierr)
+    mpi_get_address (dx, displs[1], ierr)
+
+    type_group = np.int32(-1)
+    nb_blocks = np.int32(2)
+    mpi_type_create_struct (nb_blocks, blocklens, displs, types, type_group, ierr)
+    mpi_type_commit (type_group, ierr)
+
+    count = np.int32(1)
+    mpi_bcast (MPI_BOTTOM, count, type_group, master, comm, ierr)
+
+    print('I, process ', rank, ', received ', n[0], dx[0], ' from process ', master)
+
+    mpi_type_free (type_group, ierr)
+
+    mpi_finalize(ierr)
@@ -0,0 +1,42 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring
+# coding: utf-8
+
+from pyccel.stdlib.internal.mpi import mpi_init
+from pyccel.stdlib.internal.mpi import mpi_finalize
+from pyccel.stdlib.internal.mpi import mpi_comm_size
+from pyccel.stdlib.internal.mpi import mpi_comm_rank
+from pyccel.stdlib.internal.mpi import mpi_comm_world
+from pyccel.stdlib.internal.mpi import mpi_status_size
+from pyccel.stdlib.internal.mpi import mpi_ibarrier
+from pyccel.stdlib.internal.mpi import mpi_wait
+
+import numpy as np
+
+if __name__ == '__main__':
+    # we need to declare these variables somehow,
+    # since we are calling mpi subroutines
+    ierr = np.int32(-1)
+    sizes = np.int32(-1)
+    rank = np.int32(-1)
+
+    mpi_init(ierr)
+
+    comm = mpi_comm_world
+    mpi_comm_size(comm, sizes, ierr)
+    mpi_comm_rank(comm, rank, ierr)
+
+    # ... start the barrier and do some work while waiting for the other processes
+    req = np.int32(-1)
+    mpi_ibarrier(comm, req, ierr)
+
+    x = 0
+    for i in range(1000):
+        x += i
+
+    status = np.zeros(mpi_status_size, 'int32')
+    mpi_wait(req, status, ierr)
+    # ...
+
+    print('I, process ', rank, ', computed ', x)
+
+    mpi_finalize(ierr)
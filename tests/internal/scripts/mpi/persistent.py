@@ -0,0 +1,70 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring
+# coding: utf-8
+
+from pyccel.stdlib.internal.mpi import mpi_init
+from pyccel.stdlib.internal.mpi import mpi_finalize
+from pyccel.stdlib.internal.mpi import mpi_comm_size
+from pyccel.stdlib.internal.mpi import mpi_comm_rank
+from pyccel.stdlib.internal.mpi import mpi_comm_world
+from pyccel.stdlib.internal.mpi import mpi_status_size
+from pyccel.stdlib.internal.mpi import mpi_send_init
+from pyccel.stdlib.internal.mpi import mpi_recv_init
+from pyccel.stdlib.internal.mpi import mpi_startall
+from pyccel.stdlib.internal.mpi import mpi_waitall
+from pyccel.stdlib.internal.mpi import mpi_request_free
+from pyccel.stdlib.internal.mpi import mpi_f_sync_reg
+from pyccel.stdlib.internal.mpi import MPI_REAL8
+
+import numpy as np
+
+if __name__ == '__main__':
+    # we need to declare these variables somehow,
+    # since we are calling mpi subroutines
+    ierr = np.int32(-1)
+    sizes = np.int32(-1)
+    rank = np.int32(-1)
+
+    mpi_init(ierr)
+
+    comm = mpi_comm_world
+    mpi_comm_size(comm, sizes, ierr)
+    mpi_comm_rank(comm, rank, ierr)
+
+    n = np.int32(4)
+    x = np.zeros(n)
+    y = np.zeros(n)
+
+    # ...
+    tag = np.int32(1234)
+    nreqs = np.int32(2)
+    reqs = np.zeros(nreqs, 'int32')
+    statuses = np.zeros((mpi_status_size, nreqs), 'int32')
+    # ...
+
+    # ...
+    before = np.int32(rank - 1)
+    after  = np.int32(rank + 1)
+    if rank == 0:
+        before = np.int32(sizes - 1)
+    if rank == sizes - 1:
+        after  = np.int32(0)
+
+    # ... the requests are created once and reused at each step
+    mpi_recv_init(y, n, MPI_REAL8, before, tag, comm, reqs[0], ierr)
+    mpi_send_init(x, n, MPI_REAL8, after , tag, comm, reqs[1], ierr)
+
+    for step in range(3):
+        x[:] = rank + step
+        # ... the buffers are accessed by MPI outside of the calls
+        mpi_f_sync_reg(x)
+        mpi_startall(nreqs, reqs, ierr)
+        mpi_waitall(nreqs, reqs, statuses, ierr)
+        mpi_f_sync_reg(y)
+
+        print('I, process ', rank, ', received ', y[0], y[n-1], ' from process ', before)
+
+    mpi_request_free(reqs[0], ierr)
+    mpi_request_free(reqs[1], ierr)
+    # ...
+
+    mpi_finalize(ierr)